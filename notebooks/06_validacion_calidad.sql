@@ -58,6 +58,20 @@ SELECT
 FROM dbo.FactVentas
 WHERE sk_moneda = -1;
 
+-- Miembros inferidos (late-arriving) pendientes de su fila real
+-- Ver DataLoader.assign_late_arriving_keys / rekey_late_arriving_facts (src/etl/load.py)
+SELECT 'DimCliente inferidos' AS problema, COUNT(*) AS cantidad
+FROM dbo.DimCliente WHERE nombre = 'Inferido'
+UNION ALL
+SELECT 'DimProducto inferidos', COUNT(*)
+FROM dbo.DimProducto WHERE marca = 'Inferido'
+UNION ALL
+SELECT 'DimLocal inferidos', COUNT(*)
+FROM dbo.DimLocal WHERE provincia = 'Inferido'
+UNION ALL
+SELECT 'DimVendedor inferidos', COUNT(*)
+FROM dbo.DimVendedor WHERE nombre = 'Inferido';
+
 PRINT '';
 GO
 
@@ -0,0 +1,102 @@
+"""
+Command Line Entry Point
+Runs individual ETL steps: python -m src {extract,transform,load} ...
+
+Only argparse is imported at startup; the ETL modules (and pandas/SQLAlchemy)
+are loaded once a step actually runs, so --help and short cron jobs stay fast.
+"""
+
+import argparse
+import sys
+
+
+def run_extract(args) -> int:
+    """Extract from a CSV file or a SQL query and write the result to CSV"""
+    from src.etl.extract import DataExtractor
+
+    extractor = DataExtractor()
+    if args.csv:
+        df = extractor.extract_from_csv(args.csv)
+    else:
+        df = extractor.extract_from_database(args.query, None)
+
+    df.to_csv(args.output, index=False)
+    print(f"Wrote {len(df)} rows to {args.output}")
+    return 0
+
+
+def run_transform(args) -> int:
+    """Clean and standardize a CSV file"""
+    from src.etl.extract import DataExtractor
+    from src.etl.transform import DataTransformer
+
+    df = DataExtractor().extract_from_csv(args.input)
+    transformer = DataTransformer()
+    df = transformer.clean_data(df)
+    if args.standardize_columns:
+        df = transformer.standardize_columns(df)
+
+    df.to_csv(args.output, index=False)
+    print(f"Wrote {len(df)} rows to {args.output}")
+    return 0
+
+
+def run_load(args) -> int:
+    """Load a CSV file into a database table (connection from environment)"""
+    from src.etl.extract import DataExtractor
+    from src.etl.load import DataLoader
+
+    df = DataExtractor().extract_from_csv(args.input)
+    loader = DataLoader()
+    try:
+        ok = loader.load_to_database(df, args.table, if_exists=args.if_exists)
+    finally:
+        loader.close()
+    return 0 if ok else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='Retail Sales Data Warehouse - ETL steps'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    extract = subparsers.add_parser('extract', help='Extract data to a CSV file')
+    source = extract.add_mutually_exclusive_group(required=True)
+    source.add_argument('--csv', help='Source CSV file')
+    source.add_argument('--query', help='SQL query (connection read from DB_* variables / .env)')
+    extract.add_argument('--output', required=True, help='Destination CSV file')
+    extract.set_defaults(func=run_extract)
+
+    transform = subparsers.add_parser('transform', help='Clean a CSV file')
+    transform.add_argument('input', help='Source CSV file')
+    transform.add_argument('output', help='Destination CSV file')
+    transform.add_argument('--standardize-columns', action='store_true',
+                           help='Lowercase column names and replace spaces with underscores')
+    transform.set_defaults(func=run_transform)
+
+    load = subparsers.add_parser('load', help='Load a CSV file into a table')
+    load.add_argument('input', help='Source CSV file')
+    load.add_argument('--table', required=True, help='Target table name')
+    load.add_argument('--if-exists', default='append', choices=['fail', 'replace', 'append'],
+                      help='Behavior if the table exists (default: append)')
+    load.set_defaults(func=run_load)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """Main CLI function"""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""
+Fact Index Module - Local Query Acceleration
+Date-sorted fact layout with per-block zone maps and bitmap indexes
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, Any, List
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Low-cardinality keys analysts filter on
+DEFAULT_BITMAP_COLUMNS = ['sk_canal', 'sk_moneda', 'sk_forma_pago', 'provincia']
+
+DEFAULT_BLOCK_SIZE = 4096
+
+# NaT as returned by _to_days (int64 minimum)
+NAT_DAYS = -2 ** 63
+
+
+class FactIndex:
+    """
+    Index over the staged / flattened fact data
+
+    Rows are stored sorted by date and split in fixed-size blocks. Each block
+    keeps a min/max date (zone map) over its non-missing dates, and each value
+    of a low-cardinality column keeps a bit-packed bitmap (one bit per row).
+    Rows without a date only match queries with no date bound. Queries AND the
+    bitmaps together, skip blocks whose zone map or bitmap excludes them and
+    only then read rows from the remaining blocks.
+    """
+
+    def __init__(self, data: pd.DataFrame, date_column: str, bitmap_columns: List[str],
+                 block_size: int, zone_min: np.ndarray, zone_max: np.ndarray,
+                 categories: Dict[str, list], bitmaps: Dict[str, np.ndarray],
+                 zone_has_null: np.ndarray = None):
+        """
+        Initialize the FactIndex (use build() or load() instead)
+
+        Args:
+            data: Fact rows sorted by date_column
+            date_column: Date column used for the sorted layout and zone maps
+            bitmap_columns: Columns with bitmap indexes
+            block_size: Rows per block (multiple of 8)
+            zone_min: Minimum date per block (days since epoch)
+            zone_max: Maximum date per block (days since epoch)
+            categories: Distinct values per bitmap column
+            bitmaps: Packed bitmaps per column, shape (n_values, n_bytes)
+            zone_has_null: Whether each block holds rows without a date
+        """
+        self.data = data
+        self.date_column = date_column
+        self.bitmap_columns = bitmap_columns
+        self.block_size = block_size
+        self.zone_min = zone_min
+        self.zone_max = zone_max
+        self.zone_has_null = zone_has_null if zone_has_null is not None \
+            else np.zeros(len(zone_min), dtype=bool)
+        self.categories = categories
+        self.bitmaps = bitmaps
+        self.last_query_stats = {}
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, date_column: str = 'fecha_venta',
+              bitmap_columns: List[str] = None,
+              block_size: int = DEFAULT_BLOCK_SIZE) -> 'FactIndex':
+        """
+        Build the index from a fact DataFrame
+
+        Args:
+            df: Fact rows (e.g. 07_dataset_aplanado.sql output or staged FactVentas)
+            date_column: Date column to sort by
+            bitmap_columns: Low-cardinality columns to index (defaults to the
+                ones present among DEFAULT_BITMAP_COLUMNS)
+            block_size: Rows per block, must be a multiple of 8
+
+        Returns:
+            FactIndex instance
+        """
+        if block_size <= 0 or block_size % 8 != 0:
+            raise ValueError(f"block_size must be a positive multiple of 8: {block_size}")
+
+        if bitmap_columns is None:
+            bitmap_columns = [c for c in DEFAULT_BITMAP_COLUMNS if c in df.columns]
+
+        data = df.copy()
+        data[date_column] = pd.to_datetime(data[date_column])
+        data = data.sort_values(date_column, kind='stable').reset_index(drop=True)
+
+        days = cls._to_days(data[date_column])
+        valid = days != NAT_DAYS
+        n_blocks = -(-len(data) // block_size)
+        starts = np.arange(n_blocks) * block_size
+
+        # Missing dates (sorted last) are left out of the zone maps; a block
+        # with no valid date gets an empty range that no date bound matches
+        int64 = np.iinfo(np.int64)
+        if n_blocks:
+            zone_min = np.minimum.reduceat(np.where(valid, days, int64.max), starts)
+            zone_max = np.maximum.reduceat(np.where(valid, days, int64.min), starts)
+            zone_has_null = np.logical_or.reduceat(~valid, starts)
+        else:
+            zone_min = zone_max = np.array([], dtype=np.int64)
+            zone_has_null = np.array([], dtype=bool)
+
+        categories = {}
+        bitmaps = {}
+        for col in bitmap_columns:
+            codes, uniques = pd.factorize(data[col], sort=True)
+            categories[col] = uniques.tolist()
+            matches = codes[np.newaxis, :] == np.arange(len(uniques))[:, np.newaxis]
+            bitmaps[col] = np.packbits(matches, axis=1)
+
+        print(f"Built fact index: {len(data)} rows, {n_blocks} blocks, "
+              f"{len(bitmap_columns)} bitmap columns")
+
+        return cls(data, date_column, bitmap_columns, block_size,
+                   zone_min, zone_max, categories, bitmaps, zone_has_null)
+
+    @staticmethod
+    def _to_days(values) -> np.ndarray:
+        """Convert dates to int64 days since epoch"""
+        return pd.to_datetime(pd.Series(values)).to_numpy(dtype='datetime64[D]').astype(np.int64)
+
+    def _value_bitmap(self, column: str, values) -> np.ndarray:
+        """
+        Get the OR of the bitmaps for one or more values of a column
+
+        Args:
+            column: Bitmap column
+            values: Scalar or list of values (IN semantics)
+
+        Returns:
+            Packed bitmap
+        """
+        if column not in self.bitmaps:
+            raise ValueError(f"No bitmap index on column: {column}")
+
+        if not isinstance(values, (list, tuple, set)):
+            values = [values]
+
+        lookup = {v: i for i, v in enumerate(self.categories[column])}
+        positions = [lookup[v] for v in values if v in lookup]
+
+        if not positions:
+            return np.zeros(self.bitmaps[column].shape[1], dtype=np.uint8)
+        return np.bitwise_or.reduce(self.bitmaps[column][positions], axis=0)
+
+    def query(self, date_from=None, date_to=None, columns: List[str] = None,
+              **filters) -> pd.DataFrame:
+        """
+        Select fact rows by date range and equality / IN filters
+
+        Example:
+            index.query('2024-01-01', '2024-03-31', sk_canal=[1, 2], provincia='Córdoba')
+
+        Args:
+            date_from: Inclusive lower date bound (None for open)
+            date_to: Inclusive upper date bound (None for open)
+            columns: Columns to return (defaults to all)
+            **filters: Bitmap column -> value or list of values
+
+        Returns:
+            DataFrame with matching rows, in date order
+        """
+        n_rows = len(self.data)
+        n_blocks = len(self.zone_min)
+        block_bytes = self.block_size // 8
+
+        # 1. Zone maps: blocks overlapping the date range
+        candidate = np.ones(n_blocks, dtype=bool)
+        lo = self._to_days([date_from])[0] if date_from is not None else None
+        hi = self._to_days([date_to])[0] if date_to is not None else None
+        if lo is not None:
+            candidate &= self.zone_max >= lo
+        if hi is not None:
+            candidate &= self.zone_min <= hi
+
+        # 2. Bitmap AND over all predicates
+        bitmap = None
+        for column, values in filters.items():
+            value_bitmap = self._value_bitmap(column, values)
+            bitmap = value_bitmap if bitmap is None else np.bitwise_and(bitmap, value_bitmap)
+
+        if bitmap is not None and n_blocks:
+            padded = np.zeros(n_blocks * block_bytes, dtype=np.uint8)
+            padded[:len(bitmap)] = bitmap
+            candidate &= padded.reshape(n_blocks, block_bytes).any(axis=1)
+
+        # 3. Read only the surviving blocks
+        positions = []
+        for block in np.flatnonzero(candidate):
+            start = block * self.block_size
+            stop = min(start + self.block_size, n_rows)
+
+            if bitmap is not None:
+                bits = np.unpackbits(bitmap[start // 8:-(-stop // 8)], count=stop - start)
+                rows = start + np.flatnonzero(bits)
+            else:
+                rows = np.arange(start, stop)
+
+            # Only blocks straddling a bound, or holding rows without a date,
+            # need a row-level date check
+            bounded = lo is not None or hi is not None
+            if (lo is not None and self.zone_min[block] < lo) or \
+                    (hi is not None and self.zone_max[block] > hi) or \
+                    (bounded and self.zone_has_null[block]):
+                days = self._to_days(self.data[self.date_column].to_numpy()[rows])
+                keep = days != NAT_DAYS
+                if lo is not None:
+                    keep &= days >= lo
+                if hi is not None:
+                    keep &= days <= hi
+                rows = rows[keep]
+
+            positions.append(rows)
+
+        positions = np.concatenate(positions) if positions else np.array([], dtype=np.int64)
+        result = self.data.iloc[positions]
+        if columns is not None:
+            result = result[columns]
+
+        self.last_query_stats = {
+            'blocks_total': n_blocks,
+            'blocks_read': int(candidate.sum()),
+            'rows_returned': len(result)
+        }
+
+        return result
+
+    def save(self, directory: str):
+        """
+        Persist the index to a directory (data, compressed bitmaps, metadata)
+
+        Args:
+            directory: Destination directory (created if needed)
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        self.data.to_pickle(os.path.join(directory, 'data.pkl'))
+
+        arrays = {'zone_min': self.zone_min, 'zone_max': self.zone_max,
+                  'zone_has_null': self.zone_has_null}
+        arrays.update({f"bitmap__{col}": bm for col, bm in self.bitmaps.items()})
+        np.savez_compressed(os.path.join(directory, 'index.npz'), **arrays)
+
+        metadata = {
+            'date_column': self.date_column,
+            'bitmap_columns': self.bitmap_columns,
+            'block_size': self.block_size,
+            'categories': self.categories
+        }
+        with open(os.path.join(directory, 'metadata.json'), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, default=str)
+
+        print(f"Saved fact index to {directory}")
+
+    @classmethod
+    def load(cls, directory: str) -> 'FactIndex':
+        """
+        Load an index previously written with save()
+
+        Args:
+            directory: Source directory
+
+        Returns:
+            FactIndex instance
+        """
+        with open(os.path.join(directory, 'metadata.json'), encoding='utf-8') as f:
+            metadata = json.load(f)
+
+        data = pd.read_pickle(os.path.join(directory, 'data.pkl'))
+
+        with np.load(os.path.join(directory, 'index.npz')) as arrays:
+            zone_min = arrays['zone_min']
+            zone_max = arrays['zone_max']
+            zone_has_null = arrays['zone_has_null']
+            bitmaps = {col: arrays[f"bitmap__{col}"] for col in metadata['bitmap_columns']}
+
+        return cls(data, metadata['date_column'], metadata['bitmap_columns'],
+                   metadata['block_size'], zone_min, zone_max,
+                   metadata['categories'], bitmaps, zone_has_null)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index size statistics
+
+        Returns:
+            Dictionary with rows, blocks and bitmap sizes
+        """
+        return {
+            'rows': len(self.data),
+            'blocks': len(self.zone_min),
+            'block_size': self.block_size,
+            'bitmap_bytes': {col: int(bm.nbytes) for col, bm in self.bitmaps.items()}
+        }
+
+
+if __name__ == "__main__":
+    # Example usage
+    # df = pd.read_excel('data/processed/DW_Dataset_Aplanado.xlsx')
+    # index = FactIndex.build(df, bitmap_columns=['canal', 'codigo_moneda', 'forma_pago', 'provincia'])
+    # print(index.query('2024-01-01', '2024-03-31', provincia='Córdoba'))
+
+    print("Fact index module loaded successfully")
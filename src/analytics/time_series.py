@@ -0,0 +1,436 @@
+"""
+Time Series Module - Temporal Analytics
+Dense period x entity cubes for YoY, MoM, moving averages and quarter rankings
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, List
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+DEFAULT_MEASURES = ['importe', 'margen', 'cantidad']
+
+
+class SalesCube:
+    """
+    Pre-bucketed sales time series
+
+    Facts are summed once into dense NumPy arrays of shape
+    (periods, entities, measures) at day and month grain, where entities are
+    the values of one key column (product, store, seller...). Analytics are
+    then array shifts and cumulative sums instead of window functions over
+    the joined fact (see sql/views/08_analisis_temporal.sql).
+
+    Periods are calendar-contiguous: a month without sales is a zero row, so
+    MoM compares against the previous calendar month.
+    """
+
+    def __init__(self, date_column: str = 'fecha_venta', entity_column: str = None,
+                 measures: List[str] = None):
+        """
+        Initialize an empty SalesCube
+
+        Args:
+            date_column: Fact date column
+            entity_column: Key to break series down by (e.g. 'sk_producto');
+                None keeps a single total series
+            measures: Additive measures to accumulate
+        """
+        self.date_column = date_column
+        self.entity_column = entity_column
+        self.measures = measures or list(DEFAULT_MEASURES)
+
+        self.entities = []
+        self.entity_positions = {}
+        self.first_day = None
+        self.first_month = None
+        # Fact rows skipped because they have no date
+        self.rows_without_date = 0
+        # Last slot counts fact rows, to tell empty periods from zero totals
+        n_slots = len(self.measures) + 1
+        self.daily = np.zeros((0, 0, n_slots))
+        self.monthly = np.zeros((0, 0, n_slots))
+        self._daily_cumsum = np.zeros((0, 0, n_slots))
+        self._cumsum_valid_until = 0
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, date_column: str = 'fecha_venta',
+              entity_column: str = None, measures: List[str] = None) -> 'SalesCube':
+        """
+        Build a cube from fact rows
+
+        Args:
+            df: Fact rows with date_column, entity_column and measures
+            date_column: Fact date column
+            entity_column: Key to break series down by (None for totals)
+            measures: Additive measures to accumulate
+
+        Returns:
+            SalesCube instance
+        """
+        cube = cls(date_column, entity_column, measures)
+        cube.append(df)
+        return cube
+
+    def _entity_positions_for(self, values) -> np.ndarray:
+        """Map entity values to cube positions, registering new ones"""
+        if self.entity_column is None:
+            return np.zeros(len(values), dtype=np.int64)
+
+        for value in pd.unique(values):
+            if value not in self.entity_positions:
+                self.entity_positions[value] = len(self.entities)
+                self.entities.append(value)
+
+        return pd.Index(self.entities).get_indexer(values).astype(np.int64)
+
+    @staticmethod
+    def _grow(array: np.ndarray, start: int, first: int, last: int,
+              n_entities: int) -> tuple:
+        """
+        Extend an array so it covers periods [first, last] and n_entities
+
+        Returns:
+            (new array, new start period)
+        """
+        if array.shape[0] == 0:
+            new_start = first
+            new_end = last + 1
+        else:
+            new_start = min(start, first)
+            new_end = max(start + array.shape[0], last + 1)
+
+        if (new_start, new_end - new_start, n_entities) == (start, array.shape[0], array.shape[1]):
+            return array, start
+
+        grown = np.zeros((new_end - new_start, n_entities, array.shape[2]))
+        offset = 0 if array.shape[0] == 0 else start - new_start
+        grown[offset:offset + array.shape[0], :array.shape[1]] = array
+        return grown, new_start
+
+    def append(self, df: pd.DataFrame):
+        """
+        Add new fact rows (e.g. the days processed by 05_reproceso_diario.sql)
+
+        Only the affected buckets are summed and the cumulative sums are
+        recomputed from the first affected day onward. Rows without a date
+        fall in no period and are only counted in rows_without_date; missing
+        measures add nothing, as SUM skips NULLs in SQL.
+
+        Args:
+            df: Fact rows with date_column, entity_column and measures
+        """
+        dates = pd.to_datetime(df[self.date_column])
+        if dates.isna().any():
+            self.rows_without_date += int(dates.isna().sum())
+            df = df[dates.notna()]
+            dates = dates[dates.notna()]
+
+        if len(df) == 0:
+            return
+
+        days = dates.to_numpy(dtype='datetime64[D]').astype(np.int64)
+        months = dates.dt.year.to_numpy() * 12 + dates.dt.month.to_numpy() - 1
+        entities = self._entity_positions_for(
+            df[self.entity_column].to_numpy() if self.entity_column else df.index
+        )
+        values = np.column_stack([np.nan_to_num(df[self.measures].to_numpy(dtype=float)),
+                                  np.ones(len(df))])
+        n_entities = max(len(self.entities), 1)
+
+        old_first_day = self.first_day
+        self.daily, self.first_day = self._grow(self.daily, self.first_day, days.min(),
+                                                days.max(), n_entities)
+        self.monthly, self.first_month = self._grow(self.monthly, self.first_month, months.min(),
+                                                    months.max(), n_entities)
+
+        np.add.at(self.daily, (days - self.first_day, entities), values)
+        np.add.at(self.monthly, (months - self.first_month, entities), values)
+
+        # Earlier cumulative rows stay valid unless the cube grew backwards
+        if old_first_day is None or self.first_day != old_first_day:
+            self._cumsum_valid_until = 0
+        else:
+            self._cumsum_valid_until = min(self._cumsum_valid_until,
+                                           int(days.min() - self.first_day))
+
+        print(f"Appended {len(df)} rows: {self.daily.shape[0]} days, "
+              f"{self.monthly.shape[0]} months, {n_entities} entities")
+
+    def _cumsum(self) -> np.ndarray:
+        """Daily cumulative sums, recomputed only from the first stale day"""
+        start = self._cumsum_valid_until
+        if self._daily_cumsum.shape != self.daily.shape:
+            previous = self._daily_cumsum
+            self._daily_cumsum = np.zeros(self.daily.shape)
+            self._daily_cumsum[:start, :previous.shape[1]] = previous[:start]
+            if previous.shape[1] != self.daily.shape[1]:
+                start = 0
+
+        if start < self.daily.shape[0]:
+            base = self._daily_cumsum[start - 1] if start > 0 else 0.0
+            self._daily_cumsum[start:] = base + np.cumsum(self.daily[start:], axis=0)
+            self._cumsum_valid_until = self.daily.shape[0]
+
+        return self._daily_cumsum
+
+    def _series(self, measure: str, entities=None, freq: str = 'month') -> np.ndarray:
+        """
+        Get a measure as (periods, selected entities) array
+
+        Args:
+            measure: Measure name
+            entities: Entity value or list of values (None for all)
+            freq: 'month' or 'day'
+
+        Returns:
+            2D array of shape (periods, n_selected)
+        """
+        if measure not in self.measures:
+            raise ValueError(f"Unknown measure: {measure}")
+        if freq not in ('month', 'day'):
+            raise ValueError(f"Unsupported frequency: {freq}")
+
+        cube = self.monthly if freq == 'month' else self.daily
+        values = cube[:, :, self.measures.index(measure)]
+        return values[:, self._select(entities)]
+
+    def _select(self, entities) -> list:
+        """Translate entity values into cube positions"""
+        if entities is None:
+            return list(range(max(len(self.entities), 1)))
+        if not isinstance(entities, (list, tuple, set)):
+            entities = [entities]
+        return [self.entity_positions[e] for e in entities]
+
+    def _labels(self, entities) -> list:
+        """Column labels for the selected entities"""
+        if self.entity_column is None:
+            return ['total']
+        return list(self.entities) if entities is None else \
+            [e for e in (entities if isinstance(entities, (list, tuple, set)) else [entities])]
+
+    def _period_index(self, freq: str) -> pd.Index:
+        """Calendar index for the month or day axis"""
+        if freq == 'month':
+            months = np.arange(self.first_month, self.first_month + self.monthly.shape[0])
+            # Months are counted from year 0; datetime64[M] counts from 1970
+            return pd.PeriodIndex((months - 1970 * 12).astype('datetime64[M]'), freq='M')
+        days = np.arange(self.first_day, self.first_day + self.daily.shape[0])
+        return pd.DatetimeIndex(days.astype('datetime64[D]'))
+
+    @staticmethod
+    def _pct_change(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+        """Percent change, NaN where the previous value is missing or zero"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = np.round((current - previous) / previous * 100, 2)
+        pct[~np.isfinite(pct)] = np.nan
+        return pct
+
+    def _shift(self, values: np.ndarray, lag: int) -> np.ndarray:
+        """Shift along the period axis, padding with NaN"""
+        shifted = np.full(values.shape, np.nan)
+        if lag < values.shape[0]:
+            shifted[lag:] = values[:-lag]
+        return shifted
+
+    def month_over_month(self, measure: str = 'importe', entities=None,
+                         total: bool = True) -> pd.DataFrame:
+        """
+        Month-over-Month variation
+
+        Args:
+            measure: Measure name
+            entities: Entity value(s) (None for all)
+            total: Sum the selected entities into one series
+
+        Returns:
+            DataFrame per month with value, previous, absolute and % variation
+        """
+        values = self._series(measure, entities, 'month')
+        return self._variation(values, 1, entities, total, self._period_index('month'), 'mom')
+
+    def year_over_year(self, measure: str = 'importe', entities=None,
+                       total: bool = True, by: str = 'year') -> pd.DataFrame:
+        """
+        Year-over-Year variation
+
+        Args:
+            measure: Measure name
+            entities: Entity value(s) (None for all)
+            total: Sum the selected entities into one series
+            by: 'year' compares annual totals (as in 08_analisis_temporal.sql),
+                'month' compares each month with the same month a year before
+
+        Returns:
+            DataFrame with value, previous, absolute and % variation
+        """
+        values = self._series(measure, entities, 'month')
+        if by == 'month':
+            return self._variation(values, 12, entities, total, self._period_index('month'), 'yoy')
+        if by != 'year':
+            raise ValueError(f"Unsupported YoY grain: {by}")
+
+        years = self._year_totals(values)
+        first_year = self.first_month // 12
+        index = pd.Index(range(first_year, first_year + len(years)), name='anio')
+        return self._variation(years, 1, entities, total, index, 'yoy')
+
+    def _year_totals(self, monthly_values: np.ndarray) -> np.ndarray:
+        """Sum a (months, n) array into (years, n) using cumulative sums"""
+        month_of_year = self.first_month % 12
+        padded = np.vstack([np.zeros((month_of_year, monthly_values.shape[1])), monthly_values])
+        n_years = -(-padded.shape[0] // 12)
+        padded = np.vstack([padded, np.zeros((n_years * 12 - padded.shape[0], padded.shape[1]))])
+        return self._bucket_sums(padded, 12)
+
+    @staticmethod
+    def _bucket_sums(values: np.ndarray, width: int) -> np.ndarray:
+        """Sum consecutive groups of `width` rows via cumulative sums"""
+        cs = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+        return cs[width::width] - cs[:-width:width] if values.shape[0] else values
+
+    def _variation(self, values: np.ndarray, lag: int, entities, total: bool,
+                   index: pd.Index, prefix: str) -> pd.DataFrame:
+        """Build the variation DataFrame for a (periods, n) array"""
+        if total:
+            values = values.sum(axis=1, keepdims=True)
+        previous = self._shift(values, lag)
+        labels = ['total'] if total else self._labels(entities)
+
+        frames = {}
+        for i, label in enumerate(labels):
+            frames[label] = pd.DataFrame({
+                'valor': values[:, i],
+                'valor_anterior': previous[:, i],
+                f'variacion_{prefix}_absoluta': values[:, i] - previous[:, i],
+                f'variacion_{prefix}_porcentaje': self._pct_change(values[:, i], previous[:, i])
+            }, index=index)
+
+        if total:
+            return frames['total']
+        return pd.concat(frames, names=[self.entity_column, index.name or 'periodo'])
+
+    def moving_average(self, measure: str = 'importe', window: int = 3, entities=None,
+                       freq: str = 'month', total: bool = True) -> pd.DataFrame:
+        """
+        Trailing moving average (ROWS BETWEEN window-1 PRECEDING AND CURRENT ROW)
+
+        Args:
+            measure: Measure name
+            window: Number of periods
+            entities: Entity value(s) (None for all)
+            freq: 'month' or 'day'
+            total: Sum the selected entities into one series
+
+        Returns:
+            DataFrame per period (columns per entity when total is False)
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1: {window}")
+
+        if freq == 'day':
+            cs = self._cumsum()[:, self._select(entities), self.measures.index(measure)]
+        else:
+            cs = np.cumsum(self._series(measure, entities, freq), axis=0)
+        if total:
+            cs = cs.sum(axis=1, keepdims=True)
+
+        cs = np.vstack([np.zeros((1, cs.shape[1])), cs])
+        n = cs.shape[0] - 1
+        ends = np.arange(1, n + 1)
+        starts = np.maximum(ends - window, 0)
+        averages = (cs[ends] - cs[starts]) / (ends - starts)[:, np.newaxis]
+
+        columns = [f'promedio_movil_{window}'] if total else self._labels(entities)
+        return pd.DataFrame(averages, index=self._period_index(freq), columns=columns)
+
+    def running_total(self, measure: str = 'importe', entities=None,
+                      reset: str = 'year') -> pd.Series:
+        """
+        Daily running total, restarting each year or month (acumulado anual)
+
+        Args:
+            measure: Measure name
+            entities: Entity value(s) (None for all)
+            reset: 'year' or 'month'
+
+        Returns:
+            Series indexed by day
+        """
+        cs = self._cumsum()[:, self._select(entities), self.measures.index(measure)].sum(axis=1)
+        index = self._period_index('day')
+        period = index.year if reset == 'year' else index.year * 12 + index.month
+
+        # Subtract the cumulative value at the end of the previous period
+        boundaries = np.flatnonzero(np.diff(np.asarray(period))) + 1
+        offsets = np.zeros(len(cs))
+        for b in boundaries:
+            offsets[b:] = cs[b - 1]
+        return pd.Series(cs - offsets, index=index, name=f'acumulado_{reset}')
+
+    def quarter_ranking(self, measure: str = 'importe', entities=None) -> pd.DataFrame:
+        """
+        Quarter totals with overall and per-year ranking
+
+        Mirrors section 6 of 08_analisis_temporal.sql; the first and last rows
+        sorted by ranking_importe answer 06_trimestre_mas_alto.sql and
+        05_trimestre_mas_bajo.sql. Quarters without sales are left out, as in
+        the GROUP BY of those queries.
+
+        Args:
+            measure: Measure name
+            entities: Entity value(s) (None for all)
+
+        Returns:
+            DataFrame per (anio, trimestre)
+        """
+        selected = self.monthly[:, self._select(entities)].sum(axis=1)
+        values = selected[:, [self.measures.index(measure), -1]]
+        month_of_quarter = self.first_month % 3
+        padded = np.vstack([np.zeros((month_of_quarter, 2)), values])
+        n_quarters = -(-padded.shape[0] // 3)
+        padded = np.vstack([padded, np.zeros((n_quarters * 3 - padded.shape[0], 2))])
+        totals, rows = self._bucket_sums(padded, 3).T
+
+        first_quarter = (self.first_month - month_of_quarter) // 3
+        quarters = np.arange(first_quarter, first_quarter + n_quarters)
+        result = pd.DataFrame({
+            'anio': quarters // 4,
+            'trimestre': quarters % 4 + 1,
+            f'{measure}_total': totals
+        })[rows > 0].reset_index(drop=True)
+        result['ranking_importe'] = result[f'{measure}_total'].rank(method='min', ascending=False).astype(int)
+        result['ranking_anual'] = result.groupby('anio')[f'{measure}_total'] \
+            .rank(method='dense', ascending=False).astype(int)
+        return result
+
+    def extreme_quarter(self, measure: str = 'importe', highest: bool = True) -> Dict[str, Any]:
+        """
+        Quarter with the highest or lowest total
+
+        Args:
+            measure: Measure name
+            highest: True for the highest quarter, False for the lowest
+
+        Returns:
+            Dictionary with anio, trimestre and total
+        """
+        ranking = self.quarter_ranking(measure)
+        column = f'{measure}_total'
+        row = ranking.loc[ranking[column].idxmax() if highest else ranking[column].idxmin()]
+        return {'anio': int(row['anio']), 'trimestre': int(row['trimestre']),
+                column: float(row[column])}
+
+
+if __name__ == "__main__":
+    # Example usage
+    # df = pd.read_excel('data/processed/DW_Dataset_Aplanado.xlsx')
+    # cube = SalesCube.build(df, entity_column='marca')
+    # print(cube.month_over_month())
+
+    print("Time series module loaded successfully")
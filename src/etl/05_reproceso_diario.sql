@@ -52,6 +52,8 @@ BEGIN TRY
 
     -- =====================================================
     -- DIMENSIONES SCD TIPO 1 (actualización simple)
+    -- Solo se actualizan filas con cambios reales (evita reescribir toda la dimensión)
+    -- Alternativa Python: DataLoader.sync_scd1_dimension (src/etl/load.py)
     -- =====================================================
     PRINT 'Actualizando dimensiones SCD Tipo 1...';
 
@@ -61,7 +63,10 @@ BEGIN TRY
            FROM OLTP_Celulares.dbo.Clientes c) AS src(id_cliente, nombre, apellido, genero)
     ON tgt.id_cliente_fuente = src.id_cliente
     WHEN NOT MATCHED THEN INSERT(id_cliente_fuente,nombre,apellido,genero) VALUES(src.id_cliente,src.nombre,src.apellido,src.genero)
-    WHEN MATCHED THEN UPDATE SET nombre=src.nombre, apellido=src.apellido, genero=src.genero;
+    WHEN MATCHED AND (ISNULL(tgt.nombre,'') <> ISNULL(src.nombre,'')
+                   OR ISNULL(tgt.apellido,'') <> ISNULL(src.apellido,'')
+                   OR ISNULL(tgt.genero,'') <> ISNULL(src.genero,''))
+        THEN UPDATE SET nombre=src.nombre, apellido=src.apellido, genero=src.genero;
 
     PRINT '✓ DimCliente actualizada';
 
@@ -71,7 +76,11 @@ BEGIN TRY
            FROM OLTP_Celulares.dbo.Modelos m JOIN OLTP_Celulares.dbo.Marcas ma ON ma.id_marca = m.id_marca) AS src(id_modelo,marca,modelo,almacenamiento_gb,ram_gb)
     ON tgt.id_modelo_fuente = src.id_modelo
     WHEN NOT MATCHED THEN INSERT(id_modelo_fuente,marca,modelo,almacenamiento_gb,ram_gb) VALUES(src.id_modelo,src.marca,src.modelo,src.almacenamiento_gb,src.ram_gb)
-    WHEN MATCHED THEN UPDATE SET marca=src.marca, modelo=src.modelo, almacenamiento_gb=src.almacenamiento_gb, ram_gb=src.ram_gb;
+    WHEN MATCHED AND (ISNULL(tgt.marca,'') <> ISNULL(src.marca,'')
+                   OR ISNULL(tgt.modelo,'') <> ISNULL(src.modelo,'')
+                   OR ISNULL(tgt.almacenamiento_gb,-1) <> ISNULL(src.almacenamiento_gb,-1)
+                   OR ISNULL(tgt.ram_gb,-1) <> ISNULL(src.ram_gb,-1))
+        THEN UPDATE SET marca=src.marca, modelo=src.modelo, almacenamiento_gb=src.almacenamiento_gb, ram_gb=src.ram_gb;
 
     PRINT '✓ DimProducto actualizada';
 
@@ -81,7 +90,10 @@ BEGIN TRY
            FROM OLTP_Celulares.dbo.Locales l JOIN OLTP_Celulares.dbo.Ciudades c ON c.id_ciudad=l.id_ciudad) AS src(id_local,provincia,ciudad,local)
     ON tgt.id_local_fuente = src.id_local
     WHEN NOT MATCHED THEN INSERT(id_local_fuente,provincia,ciudad,local) VALUES(src.id_local,src.provincia,src.ciudad,src.local)
-    WHEN MATCHED THEN UPDATE SET provincia=src.provincia, ciudad=src.ciudad, local=src.local;
+    WHEN MATCHED AND (ISNULL(tgt.provincia,'') <> ISNULL(src.provincia,'')
+                   OR ISNULL(tgt.ciudad,'') <> ISNULL(src.ciudad,'')
+                   OR ISNULL(tgt.local,'') <> ISNULL(src.local,''))
+        THEN UPDATE SET provincia=src.provincia, ciudad=src.ciudad, local=src.local;
 
     PRINT '✓ DimLocal actualizada';
 
@@ -0,0 +1,127 @@
+"""
+Batch Tuner Module - ETL Pipeline
+Adaptive chunk sizing for database loads based on measured batch latency
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any
+
+
+class BatchSizeTuner:
+    """
+    Chooses the number of rows per INSERT batch for each table
+
+    Every batch is one to_sql call (one commit). After each batch the size
+    moves toward the one that would have taken target_seconds at the measured
+    throughput, limited to doubling/halving per step and capped by the memory
+    budget given the table's row width. The last size is kept per table so
+    the next load starts from it.
+    """
+
+    def __init__(self, target_seconds: float = 1.0, memory_budget_mb: float = 64.0,
+                 initial_chunksize: int = 1000, min_chunksize: int = 100,
+                 max_chunksize: int = 100000):
+        """
+        Initialize the BatchSizeTuner
+
+        Args:
+            target_seconds: Target commit time per batch
+            memory_budget_mb: Maximum in-memory size of one batch
+            initial_chunksize: Starting size for tables without history
+            min_chunksize: Lower bound for the chunk size
+            max_chunksize: Upper bound for the chunk size
+        """
+        self.target_seconds = target_seconds
+        self.memory_budget_mb = memory_budget_mb
+        self.initial_chunksize = initial_chunksize
+        self.min_chunksize = min_chunksize
+        self.max_chunksize = max_chunksize
+        self.sizes: Dict[str, int] = {}
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def _memory_cap(self, row_bytes: float) -> int:
+        """Largest chunk that fits in the memory budget"""
+        if row_bytes <= 0:
+            return self.max_chunksize
+        return max(self.min_chunksize, int(self.memory_budget_mb * 1024 * 1024 / row_bytes))
+
+    def initial_size(self, table_name: str, row_bytes: float) -> int:
+        """
+        Get the chunk size for the first batch of a table
+
+        Args:
+            table_name: Target table
+            row_bytes: Average in-memory size of one row
+
+        Returns:
+            Number of rows
+        """
+        size = self.sizes.get(table_name, self.initial_chunksize)
+        return max(self.min_chunksize, min(size, self.max_chunksize, self._memory_cap(row_bytes)))
+
+    def record(self, table_name: str, rows: int, seconds: float, row_bytes: float) -> int:
+        """
+        Record a finished batch and compute the next chunk size
+
+        Args:
+            table_name: Target table
+            rows: Rows written by the batch
+            seconds: Batch latency
+            row_bytes: Average in-memory size of one row
+
+        Returns:
+            Next chunk size
+        """
+        stats = self.stats.setdefault(table_name, {'rows': 0, 'seconds': 0.0, 'batches': 0,
+                                                   'slow_batches': 0})
+        stats['rows'] += rows
+        stats['seconds'] += seconds
+        stats['batches'] += 1
+        stats['last_seconds'] = seconds
+        if seconds > self.target_seconds:
+            stats['slow_batches'] += 1
+
+        current = self.sizes.get(table_name, rows)
+        if rows > 0 and seconds > 0:
+            ideal = rows * self.target_seconds / seconds
+            current = int(min(max(ideal, current / 2), current * 2))
+
+        size = max(self.min_chunksize, min(current, self.max_chunksize, self._memory_cap(row_bytes)))
+        self.sizes[table_name] = size
+        return size
+
+    def is_behind(self, table_name: str) -> bool:
+        """
+        Check whether the last batch of a table missed the target commit time
+
+        Args:
+            table_name: Target table
+
+        Returns:
+            True when the last recorded batch was slower than the target
+        """
+        stats = self.stats.get(table_name)
+        return bool(stats and stats.get('last_seconds', 0.0) > self.target_seconds)
+
+    def rows_per_second(self, table_name: str) -> float:
+        """
+        Get the achieved throughput of a table
+
+        Args:
+            table_name: Target table
+
+        Returns:
+            Rows per second over all recorded batches
+        """
+        stats = self.stats.get(table_name)
+        if not stats or stats['seconds'] <= 0:
+            return 0.0
+        return stats['rows'] / stats['seconds']
+
+
+if __name__ == "__main__":
+    # Example usage
+    tuner = BatchSizeTuner(target_seconds=0.5)
+
+    print("Batch tuner module loaded successfully")
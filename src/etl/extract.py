@@ -3,10 +3,14 @@ Extract Module - ETL Pipeline
 Handles data extraction from various sources (CSV, databases, APIs)
 """
 
-import pandas as pd
+from __future__ import annotations
+
 from typing import Dict, Any
 import os
 from src.utils.db_connection import DatabaseConnection
+from src.utils.lazy_import import lazy_import
+
+pd = lazy_import('pandas')
 
 
 class DataExtractor:
@@ -0,0 +1,199 @@
+"""
+Late Arriving Module - ETL Pipeline
+Compact index of fact rows bound to inferred dimension members
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+class LateArrivingIndex:
+    """
+    Tracks which fact rows point to an inferred dimension member, so that only
+    those rows are re-keyed when the real dimension row arrives.
+
+    Entries are kept per dimension as parallel NumPy arrays:
+        natural_key: Source key of the inferred member
+        fact_key: (id_venta << 32) | id_detalle
+        fact_date: Sale date as days since epoch (for SCD2 lookups)
+        surrogate_key: Surrogate key assigned at load time
+    """
+
+    FIELDS = ('natural_key', 'fact_key', 'fact_date', 'surrogate_key')
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self.entries: Dict[str, Dict[str, np.ndarray]] = {}
+
+    @staticmethod
+    def pack_fact_keys(id_venta, id_detalle) -> np.ndarray:
+        """
+        Pack the FactVentas primary key into a single int64
+
+        Args:
+            id_venta: Sale ids
+            id_detalle: Sale detail ids
+
+        Returns:
+            Array of packed keys
+        """
+        return (np.asarray(id_venta, dtype=np.int64) << 32) | np.asarray(id_detalle, dtype=np.int64)
+
+    @staticmethod
+    def unpack_fact_keys(fact_keys: np.ndarray) -> pd.DataFrame:
+        """
+        Unpack int64 keys back into id_venta / id_detalle columns
+
+        Args:
+            fact_keys: Packed keys
+
+        Returns:
+            DataFrame with id_venta and id_detalle
+        """
+        fact_keys = np.asarray(fact_keys, dtype=np.int64)
+        return pd.DataFrame({
+            'id_venta': fact_keys >> 32,
+            'id_detalle': fact_keys & 0xFFFFFFFF
+        })
+
+    def add(self, dimension: str, natural_keys, fact_keys, fact_dates, surrogate_keys):
+        """
+        Record fact rows bound to inferred members of a dimension
+
+        Args:
+            dimension: Dimension table name
+            natural_keys: Natural key of each fact row's inferred member
+            fact_keys: Packed fact keys
+            fact_dates: Fact dates (anything pd.to_datetime accepts)
+            surrogate_keys: Surrogate keys assigned to the fact rows
+        """
+        dates = pd.to_datetime(pd.Series(fact_dates)).to_numpy(dtype='datetime64[D]')
+        new = {
+            'natural_key': np.asarray(natural_keys, dtype=np.int64),
+            'fact_key': np.asarray(fact_keys, dtype=np.int64),
+            'fact_date': dates.astype(np.int64),
+            'surrogate_key': np.asarray(surrogate_keys, dtype=np.int64)
+        }
+
+        current = self.entries.get(dimension)
+        if current is not None:
+            # A re-loaded fact row replaces its previous entry
+            keep = ~np.isin(current['fact_key'], new['fact_key'])
+            new = {f: np.concatenate([current[f][keep], new[f]]) for f in self.FIELDS}
+
+        self.entries[dimension] = new
+
+    def pending_keys(self, dimension: str) -> np.ndarray:
+        """
+        Get the natural keys that still have inferred members
+
+        Args:
+            dimension: Dimension table name
+
+        Returns:
+            Array of unique natural keys
+        """
+        current = self.entries.get(dimension)
+        if current is None:
+            return np.array([], dtype=np.int64)
+        return np.unique(current['natural_key'])
+
+    def get(self, dimension: str, natural_keys) -> pd.DataFrame:
+        """
+        Get tracked fact rows for the given natural keys
+
+        Args:
+            dimension: Dimension table name
+            natural_keys: Natural keys to look up
+
+        Returns:
+            DataFrame with natural_key, id_venta, id_detalle, fact_date, surrogate_key
+        """
+        current = self.entries.get(dimension)
+        if current is None:
+            return pd.DataFrame(columns=['natural_key', 'id_venta', 'id_detalle',
+                                         'fact_date', 'surrogate_key'])
+
+        mask = np.isin(current['natural_key'], np.asarray(natural_keys, dtype=np.int64))
+        df = self.unpack_fact_keys(current['fact_key'][mask])
+        df.insert(0, 'natural_key', current['natural_key'][mask])
+        df['fact_date'] = current['fact_date'][mask].astype('datetime64[D]')
+        df['surrogate_key'] = current['surrogate_key'][mask]
+        return df
+
+    def discard(self, dimension: str, natural_keys):
+        """
+        Remove tracked fact rows for the given natural keys
+
+        Args:
+            dimension: Dimension table name
+            natural_keys: Natural keys whose real rows have arrived
+        """
+        current = self.entries.get(dimension)
+        if current is None:
+            return
+
+        keep = ~np.isin(current['natural_key'], np.asarray(natural_keys, dtype=np.int64))
+        if keep.any():
+            self.entries[dimension] = {f: current[f][keep] for f in self.FIELDS}
+        else:
+            del self.entries[dimension]
+
+    def size(self) -> int:
+        """
+        Get the number of tracked fact rows across all dimensions
+
+        Returns:
+            Number of entries
+        """
+        return sum(len(e['fact_key']) for e in self.entries.values())
+
+    def save(self, file_path: str):
+        """
+        Persist the index to a compressed .npz file
+
+        Args:
+            file_path: Destination path (should end in .npz, which NumPy
+                appends otherwise)
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        arrays = {
+            f"{dimension}__{field}": values[field]
+            for dimension, values in self.entries.items()
+            for field in self.FIELDS
+        }
+        np.savez_compressed(file_path, **arrays)
+
+    @classmethod
+    def load(cls, file_path: str) -> 'LateArrivingIndex':
+        """
+        Load an index previously written with save()
+
+        Args:
+            file_path: Source path
+
+        Returns:
+            LateArrivingIndex instance
+        """
+        index = cls()
+        with np.load(file_path) as data:
+            for name in data.files:
+                dimension, field = name.split('__', 1)
+                index.entries.setdefault(dimension, {})[field] = data[name]
+        return index
+
+
+if __name__ == "__main__":
+    # Example usage
+    index = LateArrivingIndex()
+
+    print("Late arriving module loaded successfully")
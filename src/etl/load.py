@@ -3,10 +3,82 @@ Load Module - ETL Pipeline
 Handles loading transformed data into the target data warehouse
 """
 
-import pandas as pd
-from typing import Dict, Any, List
-from sqlalchemy import create_engine
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from typing import Dict, Any, List, Iterable
 from src.utils.db_connection import DatabaseConnection
+from src.etl.batch_tuner import BatchSizeTuner
+from src.etl.late_arriving import LateArrivingIndex
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# SCD Type 1 dimensions synced by DataLoader.sync_scd1_dimension
+# (natural key + tracked attributes, as in 05_reproceso_diario.sql)
+SCD1_DIMENSIONS = {
+    'DimCliente': {
+        'natural_key': 'id_cliente_fuente',
+        'tracked_columns': ['nombre', 'apellido', 'genero']
+    },
+    'DimProducto': {
+        'natural_key': 'id_modelo_fuente',
+        'tracked_columns': ['marca', 'modelo', 'almacenamiento_gb', 'ram_gb']
+    },
+    'DimLocal': {
+        'natural_key': 'id_local_fuente',
+        'tracked_columns': ['provincia', 'ciudad', 'local']
+    }
+}
+
+# Label used for inferred (late-arriving) dimension members
+INFERRED_MEMBER_LABEL = 'Inferido'
+
+# Dimensions that get inferred members when a fact arrives before them.
+# fact_column is the OLTP id carried by the staged fact rows; marker_column
+# keeps INFERRED_MEMBER_LABEL until the real row overwrites the member.
+LATE_ARRIVING_DIMENSIONS = {
+    'DimCliente': {
+        'fact_column': 'id_cliente',
+        'natural_key': 'id_cliente_fuente',
+        'surrogate_key': 'sk_cliente',
+        'marker_column': 'nombre',
+        'inferred_values': {'nombre': INFERRED_MEMBER_LABEL, 'apellido': INFERRED_MEMBER_LABEL,
+                            'genero': 'X'}
+    },
+    'DimProducto': {
+        'fact_column': 'id_modelo',
+        'natural_key': 'id_modelo_fuente',
+        'surrogate_key': 'sk_producto',
+        'marker_column': 'marca',
+        'inferred_values': {'marca': INFERRED_MEMBER_LABEL, 'modelo': INFERRED_MEMBER_LABEL,
+                            'almacenamiento_gb': 0, 'ram_gb': 0}
+    },
+    'DimLocal': {
+        'fact_column': 'id_local',
+        'natural_key': 'id_local_fuente',
+        'surrogate_key': 'sk_local',
+        'marker_column': 'provincia',
+        'inferred_values': {'provincia': INFERRED_MEMBER_LABEL, 'ciudad': INFERRED_MEMBER_LABEL,
+                            'local': INFERRED_MEMBER_LABEL}
+    },
+    'DimVendedor': {
+        'fact_column': 'id_vendedor',
+        'natural_key': 'id_vendedor_fuente',
+        'surrogate_key': 'sk_vendedor',
+        'marker_column': 'nombre',
+        'valid_from': 'fecha_inicio',
+        'valid_to': 'fecha_fin',
+        'inferred_values': {'nombre': INFERRED_MEMBER_LABEL, 'apellido': INFERRED_MEMBER_LABEL,
+                            'legajo': 'INFERIDO', 'fecha_inicio': '1900-01-01', 'fecha_fin': None,
+                            'es_actual': 1, 'version': 1, 'categoria_vendedor': 'Inicial'}
+    }
+}
 
 
 class DataLoader:
@@ -14,52 +86,67 @@ class DataLoader:
     Class responsible for loading data into the data warehouse
     """
     
-    def __init__(self, connection_params: Dict[str, Any]):
+    def __init__(self, connection_params: Dict[str, Any] = None,
+                 batch_tuner: BatchSizeTuner = None,
+                 late_arriving_index_path: str = None):
         """
         Initialize the DataLoader
         
         Args:
             connection_params: Database connection parameters
+                (read from environment variables when None)
+            batch_tuner: Chunk size tuner (defaults to BatchSizeTuner())
+            late_arriving_index_path: .npz file where late_arriving_index is
+                kept between runs (in memory only when None)
         """
-        self.connection_params = connection_params
         self.db_connection = DatabaseConnection(connection_params)
+        # Resolved parameters (loaded from .env when none are given)
+        self.connection_params = self.db_connection.connection_params
         self.load_log = []
+        self.late_arriving_index_path = late_arriving_index_path
+        if late_arriving_index_path and os.path.exists(late_arriving_index_path):
+            self.late_arriving_index = LateArrivingIndex.load(late_arriving_index_path)
+        else:
+            self.late_arriving_index = LateArrivingIndex()
+        self.batch_tuner = batch_tuner or BatchSizeTuner()
     
     def load_to_database(self, df: pd.DataFrame, table_name: str, 
-                        if_exists: str = 'append', chunksize: int = 1000) -> bool:
+                        if_exists: str = 'append', chunksize: int = None) -> bool:
         """
         Load DataFrame to database table
         
+        Each batch is committed on its own. If a batch fails, the earlier
+        batches stay in the table and are reported in rows_loaded. A 'replace'
+        load that needs several batches goes through a staging table, so a
+        failure leaves the previous table untouched.
+        
         Args:
             df: DataFrame to load
             table_name: Target table name
             if_exists: How to behave if table exists ('fail', 'replace', 'append')
-            chunksize: Number of rows to insert at a time
+            chunksize: Number of rows to insert at a time (None to let
+                batch_tuner adapt it to the measured commit time)
             
         Returns:
             True if successful, False otherwise
         """
+        progress = {}
+        
         try:
             print(f"Loading {len(df)} rows to table: {table_name}")
             
-            # Create SQLAlchemy engine
-            engine = self.db_connection.get_engine()
-            
-            # Load data in chunks
-            df.to_sql(
-                name=table_name,
-                con=engine,
-                if_exists=if_exists,
-                index=False,
-                chunksize=chunksize
-            )
+            self._write_batches(df, table_name, if_exists, chunksize, progress)
             
-            print(f"Successfully loaded {len(df)} rows to {table_name}")
+            print(f"Successfully loaded {len(df)} rows to {table_name} "
+                  f"({progress['rows_per_sec']:.0f} rows/sec)")
             
             self.load_log.append({
                 'table': table_name,
                 'rows_loaded': len(df),
-                'status': 'success'
+                'status': 'success',
+                'chunksizes': progress['chunksizes'],
+                'elapsed_seconds': progress['elapsed_seconds'],
+                'rows_per_sec': progress['rows_per_sec']
             })
             
             return True
@@ -68,11 +155,270 @@ class DataLoader:
             print(f"Error loading data to {table_name}: {str(e)}")
             self.load_log.append({
                 'table': table_name,
-                'rows_loaded': 0,
+                'rows_loaded': progress.get('rows_written', 0),
+                'status': 'failed',
+                'chunksizes': progress.get('chunksizes', []),
+                'error': str(e)
+            })
+            return False
+    
+    def _write_batches(self, df: pd.DataFrame, table_name: str, if_exists: str,
+                       chunksize: int = None, progress: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Write a DataFrame in batches, one to_sql call (one commit) per batch
+        
+        A 'replace' that takes more than one batch is written to a staging
+        table and swapped in once every batch succeeded.
+        
+        Args:
+            df: DataFrame to write
+            table_name: Target table name
+            if_exists: Behavior for the first batch; later batches append
+            chunksize: Fixed batch size, or None for adaptive sizing
+            progress: Optional dict updated in place, so callers can still
+                read rows_written when a batch raises
+            
+        Returns:
+            Dictionary with chunk sizes, rows written, elapsed time and rows/sec
+        """
+        progress = {} if progress is None else progress
+        progress.update({'chunksizes': [], 'rows_written': 0,
+                         'elapsed_seconds': 0.0, 'rows_per_sec': 0.0})
+        
+        engine = self.db_connection.get_engine()
+        row_bytes = df.memory_usage(deep=True).sum() / len(df) if len(df) else 0.0
+        size = chunksize or self.batch_tuner.initial_size(table_name, row_bytes)
+        
+        swap = if_exists == 'replace' and len(df) > size
+        target_table = f"stg_replace_{table_name}" if swap else table_name
+        start = 0
+        
+        try:
+            # An empty frame still goes through to_sql so the table gets created
+            while start < len(df) or not progress['chunksizes']:
+                batch = df.iloc[start:start + size]
+                
+                # Explicit transaction so a failed batch rolls back as a whole
+                t0 = time.perf_counter()
+                with engine.begin() as connection:
+                    batch.to_sql(
+                        name=target_table,
+                        con=connection,
+                        if_exists=if_exists if start == 0 else 'append',
+                        index=False
+                    )
+                seconds = time.perf_counter() - t0
+                
+                progress['chunksizes'].append(len(batch))
+                progress['elapsed_seconds'] += seconds
+                start += len(batch)
+                if not swap:
+                    progress['rows_written'] = start
+                
+                next_size = self.batch_tuner.record(table_name, len(batch), seconds, row_bytes)
+                if chunksize is None:
+                    size = next_size
+            
+            if swap:
+                self.db_connection.execute_sql_batch(
+                    self._build_table_swap(target_table, table_name)
+                )
+                progress['rows_written'] = len(df)
+                
+        except Exception:
+            if swap:
+                self.db_connection.execute_sql(
+                    f"DROP TABLE IF EXISTS {self.db_connection.quote_identifier(target_table)}"
+                )
+            raise
+        
+        elapsed = progress['elapsed_seconds']
+        progress['elapsed_seconds'] = round(elapsed, 4)
+        progress['rows_per_sec'] = round(len(df) / elapsed, 1) if elapsed > 0 else 0.0
+        return progress
+    
+    def _build_table_swap(self, staging_table: str, table_name: str) -> List[str]:
+        """
+        Build the statements that replace a table with a fully loaded staging table
+        
+        PostgreSQL and SQLite have transactional DDL, so DROP + ALTER ... RENAME
+        run as one transaction. MySQL commits every DDL statement on its own,
+        so it uses a single atomic RENAME TABLE instead; the target is created
+        first if missing so the rename cannot fail halfway, and the old table
+        is only dropped once the new one is in place.
+        
+        Args:
+            staging_table: Staging table holding the new rows
+            table_name: Table to replace
+            
+        Returns:
+            SQL statements, executed in order
+        """
+        quote = self.db_connection.quote_identifier
+        staging = quote(staging_table)
+        table = quote(table_name)
+        
+        if self.connection_params.get('db_type') == 'mysql':
+            previous = quote(f"old_{table_name}")
+            return [
+                f"DROP TABLE IF EXISTS {previous}",
+                f"CREATE TABLE IF NOT EXISTS {table} LIKE {staging}",
+                f"RENAME TABLE {table} TO {previous}, {staging} TO {table}",
+                f"DROP TABLE {previous}"
+            ]
+        
+        return [
+            f"DROP TABLE IF EXISTS {table}",
+            f"ALTER TABLE {staging} RENAME TO {table}"
+        ]
+    
+    def _write_staging(self, df: pd.DataFrame, staging_table: str) -> Dict[str, Any]:
+        """
+        Recreate a transient staging table and fill it through _write_batches
+        
+        The table is dropped first and then appended to, so a multi-batch write
+        does not take the staging-and-swap path meant for 'replace' loads.
+        
+        Args:
+            df: Rows to stage
+            staging_table: Staging table name
+            
+        Returns:
+            Result of _write_batches
+        """
+        self.db_connection.execute_sql(
+            f"DROP TABLE IF EXISTS {self.db_connection.quote_identifier(staging_table)}"
+        )
+        return self._write_batches(df, staging_table, 'append')
+    
+    @staticmethod
+    def _combine_batch_stats(stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge the _write_batches results of several writes into one log entry
+        
+        Args:
+            stats: Results of _write_batches
+            
+        Returns:
+            Dictionary with chunk sizes, elapsed time and rows/sec
+        """
+        rows = sum(s['rows_written'] for s in stats)
+        elapsed = sum(s['elapsed_seconds'] for s in stats)
+        return {
+            'chunksizes': [size for s in stats for size in s['chunksizes']],
+            'elapsed_seconds': round(elapsed, 4),
+            'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else 0.0
+        }
+    
+    def load_stream(self, batches: Iterable[pd.DataFrame], table_name: str,
+                    if_exists: str = 'append', max_pending_batches: int = 4) -> bool:
+        """
+        Load DataFrames produced upstream (e.g. a chunked read) with backpressure
+        
+        The producer runs in a background thread and hands batches over a
+        queue. It may run up to max_pending_batches ahead of the loader, or
+        only one batch while batch_tuner reports the table behind its target
+        commit time, so a slow target throttles extraction instead of piling
+        data up in memory.
+        
+        Batches are committed as they arrive and the stream is not known in
+        advance, so with if_exists='replace' a failure after the first batch
+        leaves only the rows already written (reported in rows_loaded).
+        Stream into a staging table when the target must stay intact.
+        
+        Args:
+            batches: Iterable of DataFrames (consumed lazily)
+            table_name: Target table name
+            if_exists: Behavior for the first batch; later batches append
+            max_pending_batches: Maximum batches buffered ahead of the loader
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pending = queue.Queue()
+        slots = threading.Condition()
+        state = {'stop': False, 'error': None, 'waits': 0}
+        
+        def allowed() -> int:
+            return 1 if self.batch_tuner.is_behind(table_name) else max_pending_batches
+        
+        def produce():
+            try:
+                for batch in batches:
+                    with slots:
+                        if pending.qsize() >= allowed():
+                            state['waits'] += 1
+                        slots.wait_for(lambda: state['stop'] or pending.qsize() < allowed())
+                        if state['stop']:
+                            return
+                        pending.put(batch)
+            except Exception as e:
+                state['error'] = e
+            finally:
+                pending.put(None)
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        
+        rows = 0
+        received = 0
+        stats = {'chunksizes': [], 'elapsed_seconds': 0.0}
+        progress = {}
+        
+        try:
+            print(f"Streaming batches to table: {table_name}")
+            
+            while True:
+                batch = pending.get()
+                with slots:
+                    slots.notify()
+                if batch is None:
+                    break
+                
+                batch_stats = self._write_batches(batch, table_name,
+                                                  if_exists if received == 0 else 'append',
+                                                  progress=progress)
+                received += 1
+                rows += batch_stats['rows_written']
+                progress = {}
+                stats['chunksizes'] += batch_stats['chunksizes']
+                stats['elapsed_seconds'] += batch_stats['elapsed_seconds']
+            
+            if state['error'] is not None:
+                raise state['error']
+            
+            rows_per_sec = rows / stats['elapsed_seconds'] if stats['elapsed_seconds'] > 0 else 0.0
+            print(f"Successfully loaded {rows} rows to {table_name} "
+                  f"({rows_per_sec:.0f} rows/sec, {state['waits']} producer waits)")
+            
+            self.load_log.append({
+                'table': table_name,
+                'rows_loaded': rows,
+                'status': 'success',
+                'batches_received': received,
+                'chunksizes': stats['chunksizes'],
+                'elapsed_seconds': round(stats['elapsed_seconds'], 4),
+                'rows_per_sec': round(rows_per_sec, 1),
+                'backpressure_waits': state['waits']
+            })
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error loading data to {table_name}: {str(e)}")
+            self.load_log.append({
+                'table': table_name,
+                'rows_loaded': rows + progress.get('rows_written', 0),
                 'status': 'failed',
+                'chunksizes': stats['chunksizes'] + progress.get('chunksizes', []),
                 'error': str(e)
             })
             return False
+            
+        finally:
+            with slots:
+                state['stop'] = True
+                slots.notify_all()
     
     def load_dimension(self, df: pd.DataFrame, dimension_name: str, 
                       scd_type: int = 1) -> bool:
@@ -104,6 +450,402 @@ class DataLoader:
         
         return False
     
+    def _row_hash(self, df: pd.DataFrame, columns: List[str],
+                  reference: pd.DataFrame = None) -> pd.Series:
+        """
+        Compute a vectorized hash of the tracked attributes of each row
+        
+        Args:
+            df: DataFrame to hash
+            columns: Tracked attribute columns
+            reference: DataFrame whose dtypes drive normalization (defaults to df),
+                so that both sides of a comparison hash the same way
+            
+        Returns:
+            Series of uint64 hashes aligned with df
+        """
+        reference = df if reference is None else reference
+        normalized = pd.DataFrame(index=df.index)
+        
+        for col in columns:
+            if pd.api.types.is_numeric_dtype(reference[col]):
+                normalized[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+            else:
+                # Same semantics as ISNULL(col, '') in the SQL reprocess
+                normalized[col] = df[col].astype('string').fillna('')
+        
+        return pd.util.hash_pandas_object(normalized, index=False)
+    
+    def sync_scd1_dimension(self, df: pd.DataFrame, table_name: str,
+                            natural_key: str = None,
+                            tracked_columns: List[str] = None) -> bool:
+        """
+        Sync a SCD Type 1 dimension, touching only rows that actually changed
+        
+        Row hashes of the tracked attributes are compared on both sides; changed
+        rows are staged in a transient table and applied with a single
+        UPDATE ... FROM, and only unseen natural keys are inserted.
+        
+        Args:
+            df: Source DataFrame (natural key + tracked attributes)
+            table_name: Target dimension table (e.g. 'DimCliente')
+            natural_key: Natural key column (defaults to SCD1_DIMENSIONS)
+            tracked_columns: Attributes to compare (defaults to SCD1_DIMENSIONS)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        config = SCD1_DIMENSIONS.get(table_name, {})
+        natural_key = natural_key or config.get('natural_key')
+        tracked_columns = tracked_columns or config.get('tracked_columns')
+        
+        if not natural_key or not tracked_columns:
+            raise ValueError(f"No SCD1 configuration for dimension: {table_name}")
+        
+        staging_table = f"stg_{table_name}"
+        columns = [natural_key] + list(tracked_columns)
+        
+        try:
+            print(f"Syncing SCD1 dimension: {table_name}")
+            
+            source = df[columns].drop_duplicates(subset=[natural_key], keep='last')
+            quote = self.db_connection.quote_identifier
+            current = self.db_connection.execute_query(
+                f"SELECT {', '.join(quote(col) for col in columns)} FROM {quote(table_name)}"
+            )
+            
+            source = source.assign(_row_hash=self._row_hash(source, tracked_columns))
+            current = current.assign(
+                _row_hash=self._row_hash(current, tracked_columns, reference=source)
+            )
+            
+            # Align key dtypes so the merge does not miss matches
+            current[natural_key] = current[natural_key].astype(source[natural_key].dtype)
+            
+            merged = source.merge(
+                current[[natural_key, '_row_hash']],
+                on=natural_key,
+                how='left',
+                suffixes=('', '_current'),
+                indicator=True
+            )
+            
+            new_rows = merged.loc[merged['_merge'] == 'left_only', columns]
+            changed_mask = (merged['_merge'] == 'both') & \
+                (merged['_row_hash'] != merged['_row_hash_current'])
+            changed_rows = merged.loc[changed_mask, columns]
+            unchanged = len(source) - len(new_rows) - len(changed_rows)
+            
+            batch_stats = []
+            
+            if len(changed_rows) > 0:
+                batch_stats.append(self._write_staging(changed_rows, staging_table))
+                try:
+                    self.db_connection.execute_sql(
+                        self._build_staged_update(table_name, staging_table,
+                                                  [natural_key], tracked_columns)
+                    )
+                finally:
+                    self.db_connection.execute_sql(f"DROP TABLE {quote(staging_table)}")
+            
+            if len(new_rows) > 0:
+                batch_stats.append(self._write_batches(new_rows, table_name, 'append'))
+            
+            print(f"{table_name}: {len(new_rows)} inserted, "
+                  f"{len(changed_rows)} updated, {unchanged} unchanged")
+            
+            self.load_log.append({
+                'table': table_name,
+                'rows_loaded': len(new_rows) + len(changed_rows),
+                'rows_inserted': len(new_rows),
+                'rows_updated': len(changed_rows),
+                'rows_unchanged': unchanged,
+                'status': 'success',
+                **self._combine_batch_stats(batch_stats)
+            })
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error syncing dimension {table_name}: {str(e)}")
+            self.load_log.append({
+                'table': table_name,
+                'rows_loaded': 0,
+                'status': 'failed',
+                'error': str(e)
+            })
+            return False
+    
+    def _build_staged_update(self, table_name: str, staging_table: str,
+                             key_columns: List[str], tracked_columns: List[str]) -> str:
+        """
+        Build the set-based UPDATE that applies staged rows to the target table
+        
+        Identifiers are quoted like to_sql quotes them, so mixed-case tables
+        (e.g. "DimCliente" on PostgreSQL) resolve to the same table.
+        
+        Args:
+            table_name: Target table
+            staging_table: Staging table holding the changed rows
+            key_columns: Join columns
+            tracked_columns: Columns to overwrite
+            
+        Returns:
+            UPDATE statement for the connection's dialect
+        """
+        db_type = self.connection_params.get('db_type')
+        quote = self.db_connection.quote_identifier
+        table = quote(table_name)
+        tracked = [quote(col) for col in tracked_columns]
+        keys = [quote(col) for col in key_columns]
+        
+        if db_type == 'mysql':
+            assignments = ', '.join(f"tgt.{col} = stg.{col}" for col in tracked)
+            join = ' AND '.join(f"tgt.{col} = stg.{col}" for col in keys)
+            return (f"UPDATE {table} tgt JOIN {quote(staging_table)} stg "
+                    f"ON {join} SET {assignments}")
+        
+        # SQL Server, PostgreSQL and SQLite (3.33+) accept UPDATE ... FROM
+        assignments = ', '.join(f"{col} = stg.{col}" for col in tracked)
+        join = ' AND '.join(f"{table}.{col} = stg.{col}" for col in keys)
+        return (f"UPDATE {table} SET {assignments} "
+                f"FROM {quote(staging_table)} stg "
+                f"WHERE {join}")
+    
+    def _read_dimension_keys(self, table_name: str, config: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Read the key columns needed to resolve surrogate keys of a dimension
+        
+        Args:
+            table_name: Dimension table name
+            config: Entry of LATE_ARRIVING_DIMENSIONS
+            
+        Returns:
+            DataFrame with natural key, surrogate key, marker and validity columns
+        """
+        columns = [config['natural_key'], config['surrogate_key'], config['marker_column']]
+        if 'valid_from' in config:
+            columns += [config['valid_from'], config['valid_to']]
+        
+        quote = self.db_connection.quote_identifier
+        dim = self.db_connection.execute_query(
+            f"SELECT {', '.join(quote(col) for col in columns)} FROM {quote(table_name)} "
+            f"WHERE {quote(config['surrogate_key'])} <> -1"
+        )
+        if 'valid_from' in config:
+            dim[config['valid_from']] = pd.to_datetime(dim[config['valid_from']])
+            dim[config['valid_to']] = pd.to_datetime(dim[config['valid_to']]) \
+                .fillna(pd.Timestamp('2262-04-11'))
+        return dim
+    
+    def _lookup_dimension_rows(self, natural_keys: pd.Series, fact_dates: pd.Series,
+                               dim: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Resolve the dimension row of each fact (vectorized)
+        
+        SCD2 dimensions are matched on the version valid at the fact date,
+        like the BETWEEN fecha_inicio AND ISNULL(fecha_fin, ...) join in SQL.
+        
+        Args:
+            natural_keys: Natural key of each fact row
+            fact_dates: Date of each fact row (only used for SCD2)
+            dim: Output of _read_dimension_keys
+            config: Entry of LATE_ARRIVING_DIMENSIONS
+            
+        Returns:
+            DataFrame aligned with natural_keys holding surrogate key and marker
+            (NaN where no row matches)
+        """
+        natural_key = config['natural_key']
+        facts = pd.DataFrame({
+            natural_key: pd.to_numeric(natural_keys, errors='coerce'),
+            '_fact_date': pd.to_datetime(fact_dates) if fact_dates is not None else pd.NaT,
+            '_position': range(len(natural_keys))
+        })
+        dim = dim.assign(**{natural_key: pd.to_numeric(dim[natural_key])})
+        
+        matched = facts.merge(dim, on=natural_key, how='inner')
+        if 'valid_from' in config:
+            in_range = (matched['_fact_date'] >= matched[config['valid_from']]) & \
+                (matched['_fact_date'] <= matched[config['valid_to']])
+            matched = matched[in_range]
+        matched = matched.drop_duplicates(subset='_position', keep='last')
+        
+        result = facts[['_position']].merge(matched, on='_position', how='left')
+        result.index = natural_keys.index
+        return result[[config['surrogate_key'], config['marker_column']]]
+    
+    def assign_late_arriving_keys(self, fact_df: pd.DataFrame, table_name: str,
+                                  date_column: str = 'fecha_venta') -> pd.DataFrame:
+        """
+        Assign surrogate keys for a dimension, creating inferred members on the fly
+        
+        Natural keys not yet present in the dimension get an inferred member
+        instead of the -1 Unknown member. Fact rows bound to inferred members are
+        recorded in late_arriving_index so they can be re-keyed later without a
+        full reload (see rekey_late_arriving_facts).
+        
+        Args:
+            fact_df: Staged fact rows (id_venta, id_detalle, OLTP ids, date_column)
+            table_name: Dimension table name (key of LATE_ARRIVING_DIMENSIONS)
+            date_column: Fact date column, used for SCD2 dimensions
+            
+        Returns:
+            Copy of fact_df with the dimension's surrogate key column filled
+        """
+        config = LATE_ARRIVING_DIMENSIONS.get(table_name)
+        if config is None:
+            raise ValueError(f"No late-arriving configuration for dimension: {table_name}")
+        
+        natural_key = config['natural_key']
+        surrogate_key = config['surrogate_key']
+        marker = config['marker_column']
+        keys = fact_df[config['fact_column']]
+        dates = fact_df[date_column] if date_column in fact_df.columns else None
+        
+        dim = self._read_dimension_keys(table_name, config)
+        resolved = self._lookup_dimension_rows(keys, dates, dim, config)
+        
+        # Create one inferred member per unseen natural key
+        missing = resolved[surrogate_key].isna() & keys.notna()
+        if 'valid_from' in config:
+            # Only keys with no version at all: a date outside every version
+            # is a data issue and keeps the Unknown member
+            missing &= ~pd.to_numeric(keys, errors='coerce').isin(pd.to_numeric(dim[natural_key]))
+        missing_keys = pd.to_numeric(keys[missing]).drop_duplicates()
+        batch_stats = []
+        
+        if len(missing_keys) > 0:
+            inferred = pd.DataFrame({natural_key: missing_keys.to_numpy()})
+            for col, value in config['inferred_values'].items():
+                inferred[col] = value
+            batch_stats.append(self._write_batches(inferred, table_name, 'append'))
+            print(f"Created {len(inferred)} inferred members in {table_name}")
+            
+            dim = self._read_dimension_keys(table_name, config)
+            resolved = self._lookup_dimension_rows(keys, dates, dim, config)
+        
+        result = fact_df.copy()
+        result[surrogate_key] = resolved[surrogate_key].fillna(-1).astype('int64')
+        
+        # Track every fact row bound to an inferred member (new or pre-existing)
+        is_inferred = (resolved[marker] == INFERRED_MEMBER_LABEL).to_numpy()
+        if is_inferred.any():
+            tracked = result[is_inferred]
+            self.late_arriving_index.add(
+                table_name,
+                pd.to_numeric(tracked[config['fact_column']]),
+                LateArrivingIndex.pack_fact_keys(tracked['id_venta'], tracked['id_detalle']),
+                tracked[date_column] if dates is not None else pd.Series(pd.NaT, index=tracked.index),
+                tracked[surrogate_key]
+            )
+            self._save_late_arriving_index()
+        
+        self.load_log.append({
+            'table': table_name,
+            'rows_loaded': len(missing_keys),
+            'inferred_members': len(missing_keys),
+            'facts_on_inferred': int(is_inferred.sum()),
+            'status': 'success',
+            **self._combine_batch_stats(batch_stats)
+        })
+        
+        return result
+    
+    def rekey_late_arriving_facts(self, table_name: str,
+                                  fact_table: str = 'FactVentas') -> int:
+        """
+        Re-key only the facts whose inferred member has received its real row
+        
+        Run after the dimension sync (sync_scd1_dimension or the daily SQL
+        reprocess). SCD1 members are overwritten in place, so their facts keep
+        the same surrogate key and are only dropped from the index; SCD2 facts
+        move to the version valid at the fact date.
+        
+        Args:
+            table_name: Dimension table name (key of LATE_ARRIVING_DIMENSIONS)
+            fact_table: Fact table to update
+            
+        Returns:
+            Number of fact rows updated
+        """
+        config = LATE_ARRIVING_DIMENSIONS.get(table_name)
+        if config is None:
+            raise ValueError(f"No late-arriving configuration for dimension: {table_name}")
+        
+        pending = self.late_arriving_index.pending_keys(table_name)
+        if len(pending) == 0:
+            return 0
+        
+        natural_key = config['natural_key']
+        surrogate_key = config['surrogate_key']
+        staging_table = f"stg_{fact_table}_{surrogate_key}"
+        
+        try:
+            dim = self._read_dimension_keys(table_name, config)
+            dim = dim[pd.to_numeric(dim[natural_key]).isin(pending)]
+            
+            # A key has arrived once none of its rows still carries the marker
+            still_inferred = dim.loc[dim[config['marker_column']] == INFERRED_MEMBER_LABEL, natural_key]
+            arrived = np.setdiff1d(pd.to_numeric(dim[natural_key]).unique(),
+                                   pd.to_numeric(still_inferred).unique())
+            if len(arrived) == 0:
+                return 0
+            
+            tracked = self.late_arriving_index.get(table_name, arrived)
+            resolved = self._lookup_dimension_rows(tracked['natural_key'], tracked['fact_date'],
+                                                   dim, config)
+            tracked[surrogate_key] = resolved[surrogate_key].fillna(-1).astype('int64')
+            
+            changed = tracked[tracked[surrogate_key] != tracked['surrogate_key']]
+            changed = changed[['id_venta', 'id_detalle', surrogate_key]]
+            batch_stats = []
+            
+            if len(changed) > 0:
+                batch_stats.append(self._write_staging(changed, staging_table))
+                try:
+                    self.db_connection.execute_sql(
+                        self._build_staged_update(fact_table, staging_table,
+                                                  ['id_venta', 'id_detalle'], [surrogate_key])
+                    )
+                finally:
+                    self.db_connection.execute_sql(
+                        f"DROP TABLE {self.db_connection.quote_identifier(staging_table)}"
+                    )
+            
+            self.late_arriving_index.discard(table_name, arrived)
+            self._save_late_arriving_index()
+            
+            print(f"{table_name}: {len(arrived)} late members arrived, "
+                  f"{len(changed)} of {len(tracked)} tracked facts re-keyed")
+            
+            self.load_log.append({
+                'table': fact_table,
+                'rows_loaded': len(changed),
+                'dimension': table_name,
+                'rows_rekeyed': len(changed),
+                'status': 'success',
+                **self._combine_batch_stats(batch_stats)
+            })
+            
+            return len(changed)
+            
+        except Exception as e:
+            print(f"Error re-keying late-arriving facts for {table_name}: {str(e)}")
+            self.load_log.append({
+                'table': fact_table,
+                'rows_loaded': 0,
+                'dimension': table_name,
+                'status': 'failed',
+                'error': str(e)
+            })
+            return 0
+    
+    def _save_late_arriving_index(self):
+        """Persist late_arriving_index when a path was configured"""
+        if self.late_arriving_index_path:
+            self.late_arriving_index.save(self.late_arriving_index_path)
+    
     def load_fact(self, df: pd.DataFrame, fact_name: str) -> bool:
         """
         Load data to a fact table
@@ -120,12 +862,13 @@ class DataLoader:
         # Fact tables typically use append mode
         return self.load_to_database(df, table_name, if_exists='append')
     
-    def bulk_load(self, data_dict: Dict[str, pd.DataFrame], table_prefix: str = "") -> Dict[str, bool]:
+    def bulk_load(self, data_dict: Dict[str, Any], table_prefix: str = "") -> Dict[str, bool]:
         """
         Load multiple DataFrames to different tables
         
         Args:
-            data_dict: Dictionary mapping table names to DataFrames
+            data_dict: Dictionary mapping table names to DataFrames, or to
+                iterables of DataFrames (loaded with backpressure via load_stream)
             table_prefix: Optional prefix for table names
             
         Returns:
@@ -133,9 +876,12 @@ class DataLoader:
         """
         results = {}
         
-        for table_name, df in data_dict.items():
+        for table_name, data in data_dict.items():
             full_table_name = f"{table_prefix}{table_name}" if table_prefix else table_name
-            results[table_name] = self.load_to_database(df, full_table_name)
+            if isinstance(data, pd.DataFrame):
+                results[table_name] = self.load_to_database(data, full_table_name)
+            else:
+                results[table_name] = self.load_stream(data, full_table_name)
         
         return results
     
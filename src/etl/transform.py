@@ -3,10 +3,14 @@ Transform Module - ETL Pipeline
 Handles data transformation, cleaning, and business logic
 """
 
-import pandas as pd
-import numpy as np
+from __future__ import annotations
+
 from typing import Dict, List, Any
 from datetime import datetime
+from src.utils.lazy_import import lazy_import
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
 
 
 class DataTransformer:
@@ -3,14 +3,14 @@ Database Connection Utility
 Handles database connections and query execution
 """
 
-import pandas as pd
-from sqlalchemy import create_engine, text
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+from typing import Dict, Any, List, Optional
 import os
-from dotenv import load_dotenv
+from src.utils.lazy_import import lazy_import
 
-# Load environment variables
-load_dotenv()
+pd = lazy_import('pandas')
+sqlalchemy = lazy_import('sqlalchemy')
 
 
 class DatabaseConnection:
@@ -44,9 +44,15 @@ class DatabaseConnection:
         """
         Load connection parameters from environment variables
         
+        The .env file is only resolved here, when no explicit parameters
+        were given, instead of at import time.
+        
         Returns:
             Dictionary with connection parameters
         """
+        from dotenv import load_dotenv
+        load_dotenv()
+        
         return {
             'db_type': os.getenv('DB_TYPE', 'postgresql'),
             'host': os.getenv('DB_HOST', 'localhost'),
@@ -83,7 +89,7 @@ class DatabaseConnection:
         """Create database connection"""
         try:
             connection_string = self._build_connection_string()
-            self.engine = create_engine(connection_string, echo=False)
+            self.engine = sqlalchemy.create_engine(connection_string, echo=False)
             self.connection = self.engine.connect()
             print(f"Connected to {self.connection_params['db_type']} database")
         except Exception as e:
@@ -103,7 +109,7 @@ class DatabaseConnection:
         """
         try:
             if params:
-                df = pd.read_sql_query(text(query), self.connection, params=params)
+                df = pd.read_sql_query(sqlalchemy.text(query), self.connection, params=params)
             else:
                 df = pd.read_sql_query(query, self.connection)
             return df
@@ -124,9 +130,9 @@ class DatabaseConnection:
         """
         try:
             if params:
-                result = self.connection.execute(text(sql), params)
+                result = self.connection.execute(sqlalchemy.text(sql), params)
             else:
-                result = self.connection.execute(text(sql))
+                result = self.connection.execute(sqlalchemy.text(sql))
             self.connection.commit()
             return result
         except Exception as e:
@@ -134,6 +140,38 @@ class DatabaseConnection:
             print(f"Error executing SQL: {str(e)}")
             raise
     
+    def execute_sql_batch(self, statements: List[str]) -> None:
+        """
+        Execute several SQL statements in a single transaction
+        
+        Args:
+            statements: SQL statements, executed in order
+        """
+        try:
+            for sql in statements:
+                self.connection.execute(sqlalchemy.text(sql))
+            self.connection.commit()
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Error executing SQL batch: {str(e)}")
+            raise
+    
+    def quote_identifier(self, name: str) -> str:
+        """
+        Quote a table or column name for raw SQL
+
+        Uses the dialect's identifier preparer, the same one pandas to_sql
+        goes through, so mixed-case names created by to_sql (quoted on
+        PostgreSQL) are referenced under the same name.
+
+        Args:
+            name: Table or column name
+
+        Returns:
+            Name quoted where the dialect requires it
+        """
+        return self.engine.dialect.identifier_preparer.quote(name)
+
     def get_engine(self):
         """
         Get SQLAlchemy engine
@@ -151,7 +189,7 @@ class DatabaseConnection:
             True if connection is alive
         """
         try:
-            self.connection.execute(text("SELECT 1"))
+            self.connection.execute(sqlalchemy.text("SELECT 1"))
             return True
         except:
             return False
@@ -0,0 +1,94 @@
+"""
+Import Time Benchmark
+Measures module import cost with `python -X importtime` and checks it against a budget
+
+Usage:
+    python -m src.utils.import_benchmark [--budget-ms 100] [module ...]
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List
+
+# Modules a short-lived job imports before doing any work
+DEFAULT_MODULES = [
+    'src.__main__',
+    'src.utils.db_connection',
+    'src.etl.extract',
+    'src.etl.transform',
+    'src.etl.load',
+]
+
+DEFAULT_BUDGET_MS = 100.0
+
+
+def measure_import_time(module_name: str) -> float:
+    """
+    Measure the cumulative import time of a module in a fresh interpreter
+
+    Args:
+        module_name: Module to import
+
+    Returns:
+        Cumulative import time in milliseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) == 3 and parts[2].strip() == module_name:
+            return int(parts[1]) / 1000.0
+
+    raise RuntimeError(f"No importtime entry found for {module_name}")
+
+
+def run_benchmark(modules: List[str], budget_ms: float) -> Dict[str, float]:
+    """
+    Measure each module and print a report
+
+    Args:
+        modules: Modules to measure
+        budget_ms: Maximum allowed import time per module
+
+    Returns:
+        Dictionary mapping module names to import time (ms)
+    """
+    timings = {}
+
+    for module_name in modules:
+        timings[module_name] = measure_import_time(module_name)
+        status = 'OK' if timings[module_name] <= budget_ms else 'OVER BUDGET'
+        print(f"{module_name:<30} {timings[module_name]:>8.1f} ms  {status}")
+
+    return timings
+
+
+def main(argv=None) -> int:
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description='Check import time against a budget')
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES,
+                        help='Modules to measure')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Per-module budget in milliseconds (default: {DEFAULT_BUDGET_MS:g})')
+    args = parser.parse_args(argv)
+
+    timings = run_benchmark(args.modules, args.budget_ms)
+    over_budget = [m for m, ms in timings.items() if ms > args.budget_ms]
+
+    if over_budget:
+        print(f"Over budget ({args.budget_ms:g} ms): {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Lazy Import Utility
+Defers loading of heavy dependencies (pandas, numpy, SQLAlchemy) until first use
+
+Modules under src/ bind these with `pd = lazy_import('pandas')` at the top
+instead of a plain import, so importing a module (or running the CLI with
+--help) stays cheap and the dependency cost is only paid by code paths that
+use it. Check the effect with `python -m src.utils.import_benchmark`.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(module_name: str) -> ModuleType:
+    """
+    Import a module lazily
+
+    The module object is registered in sys.modules right away, but its code
+    only runs on the first attribute access (e.g. pd.DataFrame). Modules that
+    are already loaded are returned as-is.
+
+    Args:
+        module_name: Fully qualified module name (e.g. 'pandas')
+
+    Returns:
+        Module object (possibly not executed yet)
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.find_spec(module_name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{module_name}'", name=module_name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    loader.exec_module(module)
+    return module
+
+
+if __name__ == "__main__":
+    # Example usage
+    pd = lazy_import('pandas')
+
+    print("Lazy import utility loaded successfully")